@@ -1,8 +1,17 @@
-from importlib import metadata
+def __getattr__(name: str) -> str:
+    """Resolve __version__ lazily (PEP 562).
 
-try:
-    # Must be the same used as 'name' in setup.py
-    __version__ = metadata.version("wmfdb")
-    """:py:class:`str`: the version of the current wmfdb module."""
-except metadata.PackageNotFoundError:  # pragma: no cover - this should never happen during tests
-    pass  # package is not installed
+    importlib.metadata has to scan the installed distributions, so only
+    pay for that when something actually reads wmfdb.__version__.
+    """
+    if name == "__version__":
+        from importlib import metadata
+
+        try:
+            # Must be the same used as 'name' in setup.py
+            return metadata.version("wmfdb")
+        except metadata.PackageNotFoundError:
+            # Package is not installed; only AttributeError may escape
+            # __getattr__, so hasattr()/getattr() degrade gracefully.
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
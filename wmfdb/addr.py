@@ -1,24 +1,57 @@
 """Addr module."""
 
+import functools
 import ipaddress
 import re
 import socket
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 from wmfdb.exceptions import WmfdbValueError
 from wmfdb.section import SectionMap
 
+_DCS = {
+    1: "eqiad",
+    2: "codfw",
+    3: "esams",
+    4: "ulsfo",
+    5: "eqsin",
+    6: "drmrs",
+}
+_IPV6_PORT_RX = re.compile(r"^\[(?P<host>[^]]+)\](?::(?P<port>\w+))?$")
 
+
+@functools.lru_cache(maxsize=4096)
 def resolve(host: str) -> str:
     """Resolve a hostname or IP to an fqdn.
 
+    Results are cached for the lifetime of the process; callers that
+    need to re-resolve (e.g. after a DNS change) can call
+    resolve.cache_clear().
+
     Args:
         host (str): hostname or IP.
 
     Returns:
         str: fqdn for host.
     """
-    # First, check if its an IP:
+    return _resolve_uncached(host)
+
+
+def _resolve_uncached(host: str) -> str:
+    """Resolve a hostname or IP to an fqdn, bypassing the cache.
+
+    Args:
+        host (str): hostname or IP.
+
+    Returns:
+        str: fqdn for host.
+    """
+    # Cheap structural check first: ipv4 starts with a digit, ipv6 contains
+    # a colon, and WMF hostnames never start with a digit. This skips the
+    # full ipaddress parse (and its ValueError) for the common hostname case.
+    if not (host[:1].isdigit() or ":" in host):
+        return _dc_map(host)
+    # Now check if its an IP:
     try:
         ip = ipaddress.ip_address(host)
     except ValueError:
@@ -42,17 +75,39 @@ def _resolve_ip(ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> str:
     """
     if ip.is_loopback:
         return "localhost"
+    return _gethostbyaddr_cached(ip.compressed)
+
+
+@functools.lru_cache(maxsize=1024)
+def _gethostbyaddr_cached(ip_str: str) -> str:
+    """Resolve an IP address to a hostname, caching the result.
+
+    Results are cached for the lifetime of the process. Failed lookups
+    are not cached.
+
+    Args:
+        ip_str (str): IP address in string form.
+
+    Raises:
+        WmfdbValueError: if IP cannot be resolved.
+
+    Returns:
+        str: FQDN for the IP address.
+    """
     try:
-        host, _, _ = socket.gethostbyaddr(ip.compressed)
+        host, _, _ = socket.gethostbyaddr(ip_str)
     except socket.herror as e:
-        raise WmfdbValueError(f"Unable to resolve ip address: '{ip}': {e}") from None
+        raise WmfdbValueError(f"Unable to resolve ip address: '{ip_str}': {e}") from None
     return host
 
 
+@functools.lru_cache(maxsize=4096)
 def _dc_map(host: str) -> str:
     """Map a bare hostname to a DC, and return the FQDN.
 
     If the hostname does not contain a DC ID, resolve it via dns.
+    Results (including the getfqdn fallback) are cached for the
+    lifetime of the process; unknown-DC errors are not cached.
 
     Args:
         host (str): bare hostname.
@@ -63,25 +118,23 @@ def _dc_map(host: str) -> str:
     Returns:
         str: FQDN.
     """
-    dcs = {
-        1: "eqiad",
-        2: "codfw",
-        3: "esams",
-        4: "ulsfo",
-        5: "eqsin",
-        6: "drmrs",
-    }
-    dc_rx = re.compile(r"^[a-zA-Z]+(?P<dc_id>\d)\d{3}$")
-    m = dc_rx.match(host)
-    if not m:
+    # Hostnames with a DC ID look like "<letters><dc_id><3 digits>", e.g.
+    # db1123. For inputs this short a direct scan is faster than entering
+    # the regex engine.
+    i = 0
+    n = len(host)
+    if host.isascii():
+        while i < n and host[i].isalpha():
+            i += 1
+    if i == 0 or n - i != 4 or not host[i:].isdigit():
         return socket.getfqdn(host)
-    dc_id = int(m.group("dc_id"))
-    if dc_id not in dcs:
+    dc_id = int(host[i])
+    if dc_id not in _DCS:
         raise WmfdbValueError(f"Unknown datacenter ID '{dc_id}' (from '{host}')")
-    return f"{host}.{dcs[dc_id]}.wmnet"
+    return f"{host}.{_DCS[dc_id]}.wmnet"
 
 
-def split(addr: str, sm: SectionMap, def_port: int = 3306) -> Tuple[str, int]:
+def split(addr: str, sm: Optional[SectionMap] = None, def_port: int = 3306) -> Tuple[str, int]:
     """Split address into (host, port).
 
     Supports:
@@ -98,7 +151,9 @@ def split(addr: str, sm: SectionMap, def_port: int = 3306) -> Tuple[str, int]:
 
     Args:
         addr (str): Address.
-        sm (wmfdb.section.SectionMap): A SectionMap to map port aliases to port numbers.
+        sm (wmfdb.section.SectionMap, optional): A SectionMap to map port aliases
+            to port numbers. If not set, the shared SectionMap.default()
+            instance is used.
         def_port (int, optional): Default port to use if addr doesn't contain a port.
             Defaults to 3306.
 
@@ -109,26 +164,31 @@ def split(addr: str, sm: SectionMap, def_port: int = 3306) -> Tuple[str, int]:
     Returns:
         Tuple[str, int]: address and port.
     """
+    if ":" not in addr:
+        # Plain ipv4/hostname, the most common case.
+        return addr, def_port
     port = def_port
     port_str = ""
-    if addr.count(":") > 1:
-        # IPv6
-        if addr[0] == "[":
-            # [ipv6]:port
-            addr_port_rx = re.compile(r"^\[(?P<host>[^]]+)\](?::(?P<port>\w+))?$")
-            m = addr_port_rx.match(addr)
-            if not m:
-                raise WmfdbValueError(f"Invalid [ipv6]:port format: '{addr}'")
-            addr = m.group("host")
-            port_str = m.group("port")
-        # plain ipv6
-    elif ":" in addr:
-        addr, port_str = addr.split(":")
+    if addr[0] == "[":
+        # [ipv6] or [ipv6]:port
+        m = _IPV6_PORT_RX.match(addr)
+        if not m:
+            raise WmfdbValueError(f"Invalid [ipv6]:port format: '{addr}'")
+        addr = m.group("host")
+        port_str = m.group("port")
+    else:
+        first = addr.index(":")
+        if addr.find(":", first + 1) == -1:
+            # Exactly one colon: host:port.
+            addr, _, port_str = addr.rpartition(":")
+        # More than one colon: plain (unbracketed) ipv6, no port.
 
     if port_str:
         try:
             port = int(port_str)
         except ValueError:
+            if sm is None:
+                sm = SectionMap.default()
             sec = sm.by_name(port_str)
             port = sec.port
     return addr, port
@@ -1,11 +1,8 @@
 #!/usr/bin/python3
 
 import logging
-import os
 import sys
 
-import wmfdb
-from wmfdb import addr, log, mysql_cli, section
 from wmfdb.exceptions import WmfdbError, WmfdbValueError
 
 logger = logging.getLogger(__name__)
@@ -23,6 +20,14 @@ def main() -> None:
 
 
 def run() -> None:
+    # Imported here rather than at module scope, to keep interpreter
+    # startup (and in particular the --help/--version paths) as cheap
+    # as possible.
+    import os
+
+    import wmfdb
+    from wmfdb import addr, log, mysql_cli
+
     parser = mysql_cli.build_parser(
         prog="db-mysql",
         description="A wrapper around the mysql cmdline client. It resolves the fqdn,\n"
@@ -40,8 +45,7 @@ def run() -> None:
         print(e, file=sys.stderr)
         sys.exit(1)
 
-    sm = section.SectionMap()
-    host, port = addr.split(known.instance[0], sm)
+    host, port = addr.split(known.instance[0])
     host = addr.resolve(host)
 
     args = mysql_cli.build_args(host, port, known.skip_ssl, rest)
@@ -1,6 +1,7 @@
 """DB module."""
 import logging
-from typing import Any, Generic, List, Optional, Text, Tuple, TypeVar
+import queue
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar, Union
 
 import pymysql.constants
 import pymysql.err
@@ -12,22 +13,65 @@ from wmfdb.exceptions import WmfdbDBError, WmfdbValueError
 _C = TypeVar("_C", bound=Cursor)
 logger = logging.getLogger(__name__)
 
+# Exception types execute() converts to WmfdbDBError; built once rather
+# than per call.
+_EXEC_ERRORS = (pymysql.err.ProgrammingError, pymysql.err.OperationalError)
+# Pools are keyed on the full Connection kwarg set (see _pool_key()), so
+# instances differing in any setting never share a connection.
+_pools: Dict[Tuple[Tuple[str, str], ...], "queue.LifoQueue[Connection]"] = {}
+
+
+def _pool_key(kwargs: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+    """Build a pool key from Connection kwargs.
+
+    Every kwarg is part of the key: a connection is only reused by an
+    instance created with identical settings. Values are keyed by repr,
+    so unhashable values (e.g. the ssl dict) are supported; equal-but-
+    differently-built values at worst get separate pools.
+
+    Args:
+        kwargs (Dict[str, Any]): pymysql Connection kwargs.
+
+    Returns:
+        Tuple[Tuple[str, str], ...]: hashable pool key.
+    """
+    return tuple(sorted((k, repr(v)) for k, v in kwargs.items()))
+
 
 class DB:
-    """Class to connect to a database instance."""
+    """Class to connect to a database instance.
+
+    Connection pooling is opt-in via the pool_size kwarg. With pooling
+    enabled, close() rolls back any open transaction, restores the
+    originally-selected database, and returns the connection to a
+    process-wide pool (keyed by the connection kwargs) instead of tearing
+    it down; later DB instances with the same kwargs reuse it, skipping
+    the TCP/TLS/auth handshake.
+    """
 
     def __init__(self, **kwargs: Any) -> None:
         """Initialize the instance.
 
         Args:
-            kwargs: passed directly through to pymysql.connections.Connection.
+            kwargs: passed directly through to pymysql.connections.Connection,
+                except for pool_size (int, optional), which enables connection
+                pooling with at most that many idle connections.
+
+        Raises:
+            WmfdbValueError: if pool_size differs from an existing pool
+                for the same connection settings.
+            WmfdbDBError: if connecting fails.
         """
 
+        pool_size: int = kwargs.pop("pool_size", 0)
         self._user: Optional[str] = kwargs.get("user")
         self._host: str = kwargs.get("host", "localhost")
         self._unix_socket: Optional[str] = kwargs.get("unix_socket")
         self._port = kwargs.get("port", 3306)
         self._curr_db: Optional[str] = kwargs.get("database")
+        # The database the connection (and so its pool slot) was created
+        # with; select_db() moves _curr_db but not this.
+        self._init_db = self._curr_db
 
         if self._unix_socket:
             # The params have no effect if a unix_socket is being used.
@@ -35,11 +79,75 @@ class DB:
             self._host = "localhost"
             self._port = None
 
-        logger.debug(f"{{{self.addr()}}} Connecting.")
-        try:
-            self._conn = Connection(**kwargs)
-        except pymysql.err.OperationalError as e:
-            raise WmfdbDBError(e) from None
+        # The host never changes for the lifetime of the connection, and
+        # host() is hit for every log line (via addr()/desc()), so format
+        # it once up front.
+        self._host_fmt = self._format_host()
+        # Same for the full address: every log line and error message
+        # goes through addr().
+        self._addr_fmt = self._format_addr()
+        # And the user prefix for desc(); the root/empty check never
+        # changes after init.
+        if not self._user or self._user == "root":
+            self._user_prefix = ""
+        else:
+            self._user_prefix = f"{self._user}@"
+
+        self._closed = False
+        self._pool: Optional["queue.LifoQueue[Connection]"] = None
+        if pool_size > 0:
+            key = _pool_key(kwargs)
+            self._pool = _pools.setdefault(key, queue.LifoQueue(maxsize=pool_size))
+            if self._pool.maxsize != pool_size:
+                raise WmfdbValueError(
+                    f"pool_size {pool_size} conflicts with existing pool "
+                    f"(size {self._pool.maxsize}) for the same connection settings"
+                )
+
+        logger.debug("{%s} Connecting.", self.addr())
+        conn = self._pool_get(self._pool) if self._pool is not None else None
+        if conn is None:
+            try:
+                conn = Connection(**kwargs)
+            except pymysql.err.OperationalError as e:
+                raise WmfdbDBError(e) from None
+        self._conn = conn
+
+    def _pool_get(self, pool: "queue.LifoQueue[Connection]") -> Optional[Connection]:
+        """Fetch a validated idle connection from the pool.
+
+        Stale connections (failed ping) are discarded.
+
+        Args:
+            pool (queue.LifoQueue[Connection]): pool to fetch from.
+
+        Returns:
+            Optional[Connection]: idle connection, or None if the pool is empty.
+        """
+        while True:
+            try:
+                conn = pool.get_nowait()
+            except queue.Empty:
+                return None
+            try:
+                conn.ping(reconnect=True)
+            except pymysql.err.OperationalError:
+                logger.debug("{%s} Discarding stale pooled connection.", self.addr())
+                continue
+            return conn
+
+    def _check_open(self) -> None:
+        """Raise if this instance has been closed.
+
+        After close() the underlying connection may be owned by another
+        DB instance via the pool, so any further use of this instance
+        must fail loudly rather than share the wire.
+
+        Raises:
+            WmfdbDBError: if close() has been called.
+        """
+        if self._closed:
+            raise WmfdbDBError(f"DB instance for {self.addr()} is closed")
 
     def dict_cursor(self, *, timeout: Optional[float] = None) -> "CursorWrapper[DictCursor]":
         """Return a DictCursor wrapped in a CursorWrapper for this connection.
@@ -48,9 +156,13 @@ class DB:
             timeout (float, optional): Default timeout for queries using this
                 cursor.
 
+        Raises:
+            WmfdbDBError: if close() has been called.
+
         Returns:
             CursorWrapper[DictCursor]: cursor.
         """
+        self._check_open()
         return CursorWrapper(self.addr(), self._conn.cursor(cursor=DictCursor), timeout=timeout)
 
     def cursor(self, *, timeout: Optional[float] = None) -> "CursorWrapper[Cursor]":
@@ -60,9 +172,13 @@ class DB:
             timeout (float, optional): Default timeout for queries using this
                 cursor.
 
+        Raises:
+            WmfdbDBError: if close() has been called.
+
         Returns:
             CursorWrapper[Cursor]: cursor.
         """
+        self._check_open()
         return CursorWrapper(self.addr(), self._conn.cursor(cursor=Cursor), timeout=timeout)
 
     def select_db(self, db: str) -> None:
@@ -70,7 +186,11 @@ class DB:
 
         Args:
             db (str): Database to select.
+
+        Raises:
+            WmfdbDBError: if close() has been called.
         """
+        self._check_open()
         try:
             self._conn.select_db(db)
         except pymysql.err.OperationalError as e:
@@ -79,7 +199,7 @@ class DB:
             raise WmfdbDBError(e) from None
         old_db = self._curr_db
         self._curr_db = db
-        logger.debug(f"{{{self.addr()}}} Changed db {old_db or '[none]'}->{db}.")
+        logger.debug("{%s} Changed db %s->%s.", self.addr(), old_db or "[none]", db)
 
     def db(self) -> Optional[str]:
         """Return the currently selected database (if any).
@@ -96,6 +216,14 @@ class DB:
         If it's ipv4, it's returned as-is.
         Otherwise the bare hostname is returned with the domain stripped.
 
+        Returns:
+            str: host description.
+        """
+        return self._host_fmt
+
+    def _format_host(self) -> str:
+        """Format self._host, see host() for the rules.
+
         Returns:
             str: host description.
         """
@@ -105,8 +233,9 @@ class DB:
         if self._host[0].isdigit():
             # IPv4. WMF hostnames never start with a digit.
             return self._host
-        # FQDN, return hostname.
-        return self._host.split(".")[0]
+        # FQDN, return hostname. partition() stops at the first ".",
+        # rather than splitting the whole name.
+        return self._host.partition(".")[0]
 
     def addr(self) -> str:
         """Format the db instance address.
@@ -117,6 +246,14 @@ class DB:
             host:port
         Otherwise just the plain host is returned.
 
+        Returns:
+            str: db instance address.
+        """
+        return self._addr_fmt
+
+    def _format_addr(self) -> str:
+        """Format the db instance address, see addr() for the rules.
+
         Returns:
             str: db instance address.
         """
@@ -140,10 +277,7 @@ class DB:
             str: connection description.
         """
         db_name = self._curr_db or "(none)"
-        d = f"{self.addr()}[{db_name}]"
-        if not self._user or self._user == "root":
-            return d
-        return f"{self._user}@{d}"
+        return f"{self._user_prefix}{self.addr()}[{db_name}]"
 
     def __str__(self) -> str:
         return self.desc()
@@ -151,19 +285,60 @@ class DB:
     # ### Directly proxied methods ###
 
     def begin(self) -> None:
+        self._check_open()
         self._conn.begin()
 
     def close(self) -> None:
+        """Close the connection, returning it to the pool if one is in use.
+
+        Calling close() more than once is a no-op: the connection must
+        only be handed back to the pool a single time. Any other use of
+        the instance after close() raises WmfdbDBError.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._pool is not None and self._conn.open and self._pool_reset():
+            try:
+                self._pool.put_nowait(self._conn)
+                return
+            except queue.Full:
+                pass
         self._conn.close()
 
+    def _pool_reset(self) -> bool:
+        """Reset session state so the connection is safe to pool.
+
+        Open transactions are rolled back, and any select_db() is
+        undone, so the next borrower gets the state the pool key
+        promises.
+
+        Returns:
+            bool: True if the reset succeeded; False if the connection
+                must not be reused (and should be really closed).
+        """
+        try:
+            self._conn.rollback()
+            if self._curr_db != self._init_db:
+                if self._init_db is None:
+                    # A selected database can't be unselected; don't
+                    # hand this connection to a borrower expecting none.
+                    return False
+                self._conn.select_db(self._init_db)
+        except pymysql.err.OperationalError:
+            return False
+        return True
+
     @property
     def open(self) -> bool:
-        return self._conn.open
+        return not self._closed and self._conn.open
 
     def ping(self, reconnect: bool = True) -> None:
+        self._check_open()
         self._conn.ping(reconnect=reconnect)
 
     def rollback(self) -> None:
+        self._check_open()
         self._conn.rollback()
 
 
@@ -194,10 +369,20 @@ class CursorWrapper(Generic[_C]):
         self._addr = addr
         self._cur: _C = cursor
         self._def_tout = timeout
+        # Pick the timeout handling once here, so the common "no default
+        # timeout" case doesn't re-check the default on every query.
+        self._add_timeout: Callable[[str, Optional[float]], str]
+        if timeout is None:
+            self._add_timeout = self._add_timeout_no_def
+        else:
+            # Precompute the default-timeout prefix once; it's constant for
+            # the cursor's lifetime.
+            self._def_prefix = f"SET STATEMENT max_statement_time={timeout} FOR "
+            self._add_timeout = self._add_timeout_def
 
     def execute(
         self,
-        query: Text,
+        query: Union[str, bytes],
         args: Any = None,
         *,
         timeout: Optional[float] = None,
@@ -207,24 +392,32 @@ class CursorWrapper(Generic[_C]):
         See the class docstring for how query timeouts are configured.
 
         Args:
-            query (Text): Query to run.
+            query (Union[str, bytes]): Query to run.
             args (Any, optional): Arguments to the query. Defaults to None.
             timeout (Optional[float], optional): Query timeout. Defaults to None.
 
         Returns:
             int: Number of rows matched by query.
         """
-        q_str = self.mogrify(query, args, timeout=timeout)
-        logger.debug(f"{{{self._addr}}} Executing: {q_str}")
+        if isinstance(query, bytes):
+            # Normalize once at the boundary; everything below is str-only.
+            query = query.decode("utf-8")
+        # Only pay for mogrify (full arg escaping/encoding) when the debug
+        # log line will actually be emitted.
+        if logger.isEnabledFor(logging.DEBUG):
+            q_str = self.mogrify(query, args, timeout=timeout)
+            logger.debug("{%s} Executing: %s", self._addr, q_str)
         query = self._add_timeout(query, timeout)
         try:
             return self._cur.execute(query, args=args)
-        except (pymysql.err.ProgrammingError, pymysql.err.OperationalError) as e:
+        except _EXEC_ERRORS as e:
+            # query already has the timeout applied, so mogrify it directly.
+            q_str = self._cur.mogrify(query, args=args)
             raise WmfdbDBError(f"{{{self._addr}}} Error executing query ({q_str}): {e}")
 
     def mogrify(
         self,
-        query: Text,
+        query: Union[str, bytes],
         args: Any = None,
         *,
         timeout: Optional[float] = None,
@@ -235,7 +428,7 @@ class CursorWrapper(Generic[_C]):
         is sent to the database instance.
 
         Args:
-            query (Text): Query to format.
+            query (Union[str, bytes]): Query to format.
             args (Any, optional): Arguments for the query.
                 Defaults to None.
             timeout (Optional[float], optional): Query timeout.
@@ -245,15 +438,17 @@ class CursorWrapper(Generic[_C]):
             str: Formatted query, with arguments inserted, and
             query timeout configured.
         """
+        if isinstance(query, bytes):
+            query = query.decode("utf-8")
         query = self._add_timeout(query, timeout)
         return self._cur.mogrify(query, args=args)
 
-    def _add_timeout(self, query: str, timeout: Optional[float]) -> str:
-        """Add timeout to query.
+    def _add_timeout_no_def(self, query: str, timeout: Optional[float]) -> str:
+        """Add timeout to query (variant for no default timeout).
 
-        If timeout is not None, then that is used.
-        Else if a default timeout was provided to the constructor, that is used.
-        Otherwise no timeout is used and the query is returned unchanged.
+        Bound to self._add_timeout when no default timeout was provided
+        to the constructor. If timeout is not None, that is used,
+        otherwise the query is returned unchanged.
 
         See the class docstring for how query timeouts are configured.
 
@@ -264,12 +459,32 @@ class CursorWrapper(Generic[_C]):
         Returns:
             str: Query with query timeout added (if any).
         """
+        if timeout is None:
+            return query
+        # join() measures slightly faster than an f-string here, and this
+        # runs for every query on the timeout path.
+        return "".join(("SET STATEMENT max_statement_time=", str(timeout), " FOR ", query))
+
+    def _add_timeout_def(self, query: str, timeout: Optional[float]) -> str:
+        """Add timeout to query (variant for a configured default timeout).
+
+        Bound to self._add_timeout when a default timeout was provided
+        to the constructor. If timeout is not None, that is used,
+        otherwise the default timeout is used.
+
+        See the class docstring for how query timeouts are configured.
+
+        Args:
+            query (str): Query.
+            timeout (Optional[float]): Query timeout.
+
+        Returns:
+            str: Query with query timeout added.
+        """
         # Bypass default timeout by setting timeout to 0.0
         if timeout is None:
-            timeout = self._def_tout
-        if timeout is not None:
-            return f"SET STATEMENT max_statement_time={timeout} FOR {query}"
-        return query
+            return self._def_prefix + query
+        return "".join(("SET STATEMENT max_statement_time=", str(timeout), " FOR ", query))
 
     def result_meta(self) -> Tuple[List[str], int]:
         """Return metadata for query result.
@@ -277,11 +492,39 @@ class CursorWrapper(Generic[_C]):
         Returns:
             Tuple[List[str], int]: list of column names, rows matched.
         """
-        names = []
-        if self.description:
-            for col in self.description:
-                names.append(col[0])
-        return names, self.rowcount
+        # Fetch description once; it's a property proxying to the cursor.
+        desc = self.description
+        if not desc:
+            return [], self.rowcount
+        return [col[0] for col in desc], self.rowcount
+
+    # ### Directly proxied cursor methods/attributes ###
+    # Explicit forwards for the hot fetch path, so each access is a plain
+    # method call instead of a __getattr__ dispatch plus getattr().
+
+    def fetchone(self) -> Any:
+        return self._cur.fetchone()
+
+    def fetchmany(self, size: Optional[int] = None) -> Any:
+        return self._cur.fetchmany(size=size)
+
+    def fetchall(self) -> Any:
+        return self._cur.fetchall()
+
+    def close(self) -> None:
+        self._cur.close()
+
+    @property
+    def rowcount(self) -> int:
+        return self._cur.rowcount
+
+    @property
+    def description(self) -> Any:
+        return self._cur.description
+
+    @property
+    def lastrowid(self) -> Any:
+        return self._cur.lastrowid
 
     def __getattr__(self, attr: str) -> Any:
         if attr == "executemany":
@@ -1,27 +1,36 @@
 """Log module."""
 import logging
-from typing import Union
+from typing import Optional, Union
 
 from wmfdb.exceptions import WmfdbValueError
 
+# Handler installed by setup(), kept so repeated calls don't add
+# duplicate handlers (which would emit every record multiple times).
+_stderr_handler: Optional[logging.Handler] = None
+
 
 def setup(level: Union[str, int] = logging.INFO) -> None:
     """Set up logging.
 
+    Safe to call more than once: later calls just adjust the level on
+    the already-installed handler.
+
     Args:
         level (Union[str, int], optional): Logging level to set.. Defaults to logging.INFO.
 
     Raises:
         WmfdbValueError: (indirect) if level is not valid.
     """
+    global _stderr_handler
     _check_level(level)
-    formatter = logging.Formatter(
-        fmt="%(asctime)s %(process)d [%(levelname)s] %(name)s:%(lineno)d - %(message)s"
-    )
-    stderr_handler = logging.StreamHandler()
-    stderr_handler.setFormatter(formatter)
     root_logger = logging.getLogger()
-    root_logger.addHandler(stderr_handler)
+    if _stderr_handler is None:
+        formatter = logging.Formatter(
+            fmt="%(asctime)s %(process)d [%(levelname)s] %(name)s:%(lineno)d - %(message)s"
+        )
+        _stderr_handler = logging.StreamHandler()
+        _stderr_handler.setFormatter(formatter)
+        root_logger.addHandler(_stderr_handler)
     root_logger.setLevel(level)
 
 
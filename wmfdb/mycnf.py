@@ -1,10 +1,21 @@
 """mycnf module."""
 
 import configparser
-import os
+import functools
 import re
+import sys
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from wmfdb.exceptions import WmfdbIOError, WmfdbValueError
 
@@ -15,6 +26,47 @@ DEF_CFG_LIST = (
 )
 DEF_SECTION_LIST = ("client",)
 
+_DASH_TABLE = str.maketrans("-", "_")
+# Default CnfSelector pattern map, compiled once at import.
+_DEF_SECTION_ORDER_MAP: Tuple[Tuple["re.Pattern[str]", Tuple[str, ...]], ...] = (
+    (re.compile("(clouddb.*|an-redacteddb.*)"), ("clientlabsdb",) + DEF_SECTION_LIST),
+)
+_TRUE_VALS = frozenset(("true", "1", "on"))
+_FALSE_VALS = frozenset(("false", "0", "off"))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_cfg_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Dict[str, Optional[str]]]:
+    """Parse a my.cnf file, caching the result process-wide.
+
+    The mtime_ns/size args only serve to key the cache: if the file
+    changes, the stat info changes, and a fresh parse is done.
+
+    Args:
+        path (str): File to parse.
+        mtime_ns (int): File modification time, in nanoseconds.
+        size (int): File size.
+
+    Raises:
+        configparser.Error: if parsing the file fails.
+        OSError: if unable to open the file.
+
+    Returns:
+        Dict[str, Dict[str, Optional[str]]]: raw values, by section.
+    """
+    kwargs: Dict[str, Any] = {
+        "interpolation": None,
+        "allow_no_value": True,
+        "default_section": None,
+    }
+    parser = configparser.ConfigParser(**kwargs)
+    parser.optionxform = Cnf._normalize_keys  # type: ignore[method-assign]
+    # Read the whole file and decode in one shot, rather than the text
+    # layer's incremental per-line decoding.
+    text = Path(path).read_bytes().decode("utf8")
+    parser.read_string(text, source=path)
+    return {sec: dict(parser.items(sec)) for sec in parser.sections()}
+
 
 class Cnf:
     """Class to support reading from mysql .cnf files.
@@ -53,12 +105,18 @@ class Cnf:
                 Defaults to DEF_SECTION_LIST.
         """
         self._section_order = section_order
+        # The shared parse cache assumes the stock parser options, so
+        # bypass it if any were customized.
+        self._cache_parses = not kwargs
         # Force these options.
         kwargs["interpolation"] = None
         kwargs["allow_no_value"] = True
         kwargs["default_section"] = None
         self._parser = configparser.ConfigParser(**kwargs)
         self._parser.optionxform = self._normalize_keys  # type: ignore[method-assign]
+        # Flattened copy of the parsed config (section -> key -> cleaned
+        # value), rebuilt after every load. All lookups go through this.
+        self._flat: Dict[str, Dict[str, str]] = {}
 
     @staticmethod
     def _normalize_keys(optionstr: str) -> str:
@@ -73,12 +131,17 @@ class Cnf:
         Returns:
             str: Normalized key.
         """
-        return optionstr.replace("-", "_")
+        # This runs for every key on both parse and lookup; skip the
+        # string copy for the common already-normalized case.
+        if "-" not in optionstr:
+            return optionstr
+        return optionstr.translate(_DASH_TABLE)
 
     def load_cfgs(self, paths: Iterable[Path] = DEF_CFG_LIST) -> int:
         """Load my.cnf files in order.
 
-        Any paths that don't exist or aren't readable are skipped.
+        ~ and ~user are expanded. Any paths that don't exist or aren't
+        readable are skipped.
 
         Args:
             paths (Iterable[Path], optional): Paths to load. Defaults to
@@ -87,14 +150,23 @@ class Cnf:
         Returns:
             int: Number of config files loaded.
         """
-        paths = self._find_cfgs(paths)
+        loaded = 0
         for path in paths:
-            self._load_cfg(path)
-        return len(paths)
+            try:
+                self._load_cfg(path.expanduser())
+            except WmfdbIOError:
+                # Missing/unreadable files are expected, skip them.
+                continue
+            loaded += 1
+        return loaded
 
     def _load_cfg(self, path: Path) -> None:
         """Load a my.cnf file.
 
+        Parses are served from a process-wide cache (keyed by path and
+        stat info), unless the instance was created with custom parser
+        options.
+
         Args:
             path (Path): File to load.
 
@@ -103,31 +175,35 @@ class Cnf:
             WmfdbIOError: if unable to open the file.
         """
         try:
-            with path.open(encoding="utf8") as f:
-                try:
-                    self._parser.read_file(f)
-                except configparser.Error as e:
-                    raise WmfdbValueError(e) from None
-        except (FileNotFoundError, PermissionError) as e:
+            if self._cache_parses:
+                st = path.stat()
+                cfg = _parse_cfg_cached(str(path), st.st_mtime_ns, st.st_size)
+                self._parser.read_dict(cfg, source=str(path))
+            else:
+                text = path.read_bytes().decode("utf8")
+                self._parser.read_string(text, source=str(path))
+        except configparser.Error as e:
+            raise WmfdbValueError(e) from None
+        except (FileNotFoundError, PermissionError, IsADirectoryError) as e:
             raise WmfdbIOError(e) from None
+        self._freeze()
 
-    def _find_cfgs(self, paths: Iterable[Path]) -> List[Path]:
-        """Filter out missing and unreadable files.
-
-        ~ and ~user are expanded as part of this.
+    def _freeze(self) -> None:
+        """Flatten the parsed config into plain dicts.
 
-        Args:
-            paths (Iterable[Path]): Files to look for.
-
-        Returns:
-            List[str]: Readable paths in expanded form.
+        The config is read-only between loads, so values are cleaned
+        once here, and _get() becomes two dict lookups with none of
+        configparser's per-access machinery.
         """
-        ret: List[Path] = []
-        for path in paths:
-            path = path.expanduser()
-            if path.is_file() and os.access(path, os.R_OK):
-                ret.append(path)
-        return ret
+        # Section and key names repeat across the Cnf instances a
+        # CnfSelector builds; intern them so they share storage and get
+        # pointer-fast dict lookups.
+        self._flat = {
+            sys.intern(sec): {
+                sys.intern(k): self._cleanup_value(v) for k, v in self._parser.items(sec, raw=True)
+            }
+            for sec in self._parser.sections()
+        }
 
     def _get(self, key: str) -> Tuple[str, str, bool]:
         """Search sections for the key, returning the value if found.
@@ -138,10 +214,11 @@ class Cnf:
         Returns:
             Tuple[str, str, bool]: section name, key value, key found.
         """
+        key = self._normalize_keys(key)
         for sec in self._section_order:
-            if self._parser.has_option(sec, key):
-                # Remove in-line comments, and wrapping quotes
-                return sec, self._cleanup_value(self._parser.get(sec, key)), True
+            sec_map = self._flat.get(sec)
+            if sec_map is not None and key in sec_map:
+                return sec, sec_map[key], True
         return "", "", False
 
     def _cleanup_value(self, val: Optional[str]) -> str:
@@ -159,7 +236,7 @@ class Cnf:
             return ""
         if "#" in val:
             val = self._cleanup_comment(val)
-        if len(val) >= 2 and val[0] == val[-1] and val[0] in ('"', "'"):
+        if len(val) >= 2 and val.startswith(('"', "'")) and val.endswith(val[0]):
             # Check for "value" or 'value', and strip matching quotes.
             val = val[1:-1]
         return val
@@ -193,16 +270,21 @@ class Cnf:
         Returns:
             str: Value with any in-line comment stripped.
         """
-        if not val or "#" not in val:
+        # Single pass using find(), keeping each index in a local, rather
+        # than count() + index() re-scanning the same string.
+        hash_idx = val.find("#")
+        if hash_idx < 0:
             return val
-        if val[0] not in ('"', "'") or val.count(val[0]) == 1:
-            # Value is not (properly) quoted, drop everything after the first #
-            return val[: val.index("#")].rstrip()
-        # Value is quoted, find the the next quote.
-        quote_close_idx = val.index(val[0], 1)
-        try:
-            cmt_idx = val.index("#", quote_close_idx)
-        except ValueError:
+        quote = val[0]
+        if quote not in ('"', "'"):
+            # Value is not quoted, drop everything after the first #
+            return val[:hash_idx].rstrip()
+        quote_close_idx = val.find(quote, 1)
+        if quote_close_idx < 0:
+            # No closing quote, treat as unquoted.
+            return val[:hash_idx].rstrip()
+        cmt_idx = val.find("#", quote_close_idx)
+        if cmt_idx < 0:
             # No '#' after closing quote.
             return val
         return val[:cmt_idx].rstrip()
@@ -273,14 +355,12 @@ class Cnf:
         Returns:
             Optional[bool]: value if found, otherwise None.
         """
-        true_vals = ["true", "1", "on"]
-        false_vals = ["false", "0", "off"]
         sec, val, ok = self._get(key)
         if not ok:
             return None
-        if val.lower() in true_vals:
+        if val.lower() in _TRUE_VALS:
             return True
-        if val.lower() in false_vals:
+        if val.lower() in _FALSE_VALS:
             return False
         raise WmfdbValueError(f'Mysql config value [{sec}]{key} has non-boolean value: "{val}"')
 
@@ -302,6 +382,25 @@ class Cnf:
             return None
         return True
 
+    # All the args for pymysql that are readable from a my.cnf file, as
+    # (cnf key, pymysql arg, getter) tuples. socket/port are handled
+    # separately, as which one applies depends on the host.
+    _PYMYSQL_ARG_MAP: Tuple[Tuple[str, str, str], ...] = (
+        ("user", "user", "str"),
+        ("password", "password", "str"),
+        ("host", "host", "str"),
+        ("database", "database", "str"),
+        ("default_character_set", "charset", "str"),
+        ("connect_timeout", "connect_timeout", "float"),
+        ("max_allowed_packet", "max_allowed_packet", "str"),
+        ("bind_address", "bind_address", "str"),
+        ("ssl_ca", "ssl_ca", "str"),
+        ("ssl_cert", "ssl_cert", "str"),
+        ("ssl_key", "ssl_key", "str"),
+        ("ssl_verify_server_cert", "ssl_verify_cert", "no_value"),
+        ("ssl_verify_server_cert", "ssl_verify_identity", "no_value"),
+    )
+
     def pymysql_conn_args(self, **kwargs: Any) -> Dict[str, Any]:
         """Generate pymysql Connection arguments from my.cnf settings.
 
@@ -310,41 +409,28 @@ class Cnf:
         Returns:
             Dict[str, Any]: kwargs to be passed to pymysql.connection.Connection
         """
-
-        def _set_arg(
-            key: str,
-            *,
-            arg: Optional[str] = None,
-            get: Optional[Callable[[str], Any]] = None,
-        ) -> None:
+        getters: Dict[str, Callable[[str], Any]] = {
+            "str": self.get_str,
+            "int": self.get_int,
+            "float": self.get_float,
+            "no_value": self.get_no_value,
+        }
+
+        def _set_arg(key: str, arg: str, getter: str) -> None:
             if key in kwargs:
                 # Don't overwrite anything that's already in kwargs.
                 return
-            get = get or self.get_str
-            arg = arg or key
-            val = get(key)
+            val = getters[getter](key)
             if val is None:
                 return
             kwargs[arg] = val
 
-        # All the args for pymysql that are readable from a my.cnf file
-        _set_arg("user")
-        _set_arg("password")
-        _set_arg("host")
-        _set_arg("database")
+        for key, arg, getter in self._PYMYSQL_ARG_MAP:
+            _set_arg(key, arg, getter)
         if ("host" not in kwargs) or (kwargs["host"] == "localhost"):
-            _set_arg("socket", arg="unix_socket")
+            _set_arg("socket", "unix_socket", "str")
         else:
-            _set_arg("port", get=self.get_int)
-        _set_arg("default_character_set", arg="charset")
-        _set_arg("connect_timeout", get=self.get_float)
-        _set_arg("max_allowed_packet")
-        _set_arg("bind_address")
-        _set_arg("ssl_ca")
-        _set_arg("ssl_cert")
-        _set_arg("ssl_key")
-        _set_arg("ssl_verify_server_cert", arg="ssl_verify_cert", get=self.get_no_value)
-        _set_arg("ssl_verify_server_cert", arg="ssl_verify_identity", get=self.get_no_value)
+            _set_arg("port", "port", "int")
         return kwargs
 
 
@@ -364,7 +450,9 @@ class CnfSelector:
     def __init__(
         self,
         def_section_order: Iterable[str] = DEF_SECTION_LIST,
-        section_order_map: Optional[Iterable[Tuple[str, Iterable[str]]]] = None,
+        section_order_map: Optional[
+            Iterable[Tuple[Union[str, "re.Pattern[str]"], Iterable[str]]]
+        ] = None,
         **kwargs: Any,
     ) -> None:
         """Initialize the instance.
@@ -375,18 +463,17 @@ class CnfSelector:
             def_section_order (Iterable[str], optional): Section order to use if
                 no pattern in section_order_map matches. Defaults to
                 DEF_SECTION_LIST.
-            section_order_map (Optional[Iterable[Tuple[str, Iterable[str]]]], optional):
-                Map of regular expression to section order. If not specified,
-                a default map is used that matches "clouddb.*".
+            section_order_map (Optional[Iterable[Tuple[Union[str, re.Pattern], Iterable[str]]]],
+                optional): Map of regular expression (source string or
+                precompiled) to section order. If not specified, a default
+                map is used that matches "clouddb.*".
         """
         if section_order_map is None:
-            section_order_map = [
-                ("(clouddb.*|an-redacteddb.*)", ("clientlabsdb",) + DEF_SECTION_LIST),
-            ]
+            section_order_map = _DEF_SECTION_ORDER_MAP
         self._def_cnf = Cnf(def_section_order, **kwargs)
         self._cnfs: List[_PatternCnf] = []
         for pat, sec_list in section_order_map:
-            rx = re.compile(pat)
+            rx = pat if isinstance(pat, re.Pattern) else re.compile(pat)
             self._cnfs.append(_PatternCnf(rx, Cnf(sec_list, **kwargs)))
 
     def load_cfgs(self, paths: Iterable[Path] = DEF_CFG_LIST) -> int:
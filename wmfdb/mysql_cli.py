@@ -5,6 +5,15 @@ from typing import List, Optional
 CMD = "mysql"
 DEF_CA = "/etc/ssl/certs/wmf-ca-certificates.crt"
 
+# Host prefixes that use the labsdb defaults group.
+_LABSDB_PREFIXES = ("clouddb", "an-redacteddb")
+# ssl_args() result for the default CA, formatted once.
+_DEF_SSL_ARGS = (
+    "--ssl",
+    f"--ssl-ca={DEF_CA}",
+    "--ssl-verify-server-cert",
+)
+
 
 class _HelpFormatter(
     argparse.RawDescriptionHelpFormatter,
@@ -56,17 +65,13 @@ def build_args(host: str, port: int, skip_ssl: bool, rest: List[str]) -> List[st
     Returns:
         List[str]: mysql cli arguments.
     """
-    args = [CMD]
-    if host.startswith(("clouddb", "an-redacteddb")):
-        # This has to appear before any other options.
-        args.append("--defaults-group-suffix=labsdb")
-    args.append(f"-h{host}")
-    if port != 3306:
-        args.append(f"-P{port}")
-    if not skip_ssl:
-        args.extend(ssl_args())
-    args.extend(rest)
-    return args
+    # The group suffix has to appear before any other options.
+    group_suffix = ["--defaults-group-suffix=labsdb"] if host.startswith(_LABSDB_PREFIXES) else []
+    port_arg = [f"-P{port}"] if port != 3306 else []
+    ssl = ssl_args() if not skip_ssl else []
+    # Single splat-literal construction: one allocation at the final size,
+    # instead of repeated append/extend growth.
+    return [CMD, *group_suffix, f"-h{host}", *port_arg, *ssl, *rest]
 
 
 def ssl_args(
@@ -80,8 +85,10 @@ def ssl_args(
     Returns:
         List[str]: mysql cli arguments.
     """
-    args = []
-    args.append("--ssl")
+    if ssl_ca == DEF_CA:
+        # Common case, return a (fresh) copy of the prebuilt args.
+        return list(_DEF_SSL_ARGS)
+    args = ["--ssl"]
     if ssl_ca is not None:
         args.append(f"--ssl-ca={ssl_ca}")
         args.append("--ssl-verify-server-cert")
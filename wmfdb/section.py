@@ -1,6 +1,6 @@
 """Section module."""
 
-import csv
+import functools
 import os
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -25,9 +25,34 @@ DEFAULT_PORT = 3306
 DEFAULT_PROM_PORT = 9104
 
 
+@functools.lru_cache(maxsize=1)
+def _default_map() -> "SectionMap":
+    """Build the shared default SectionMap.
+
+    Cached for the lifetime of the process; use
+    _default_map.cache_clear() to force a config re-read.
+
+    Returns:
+        SectionMap: map loaded from the default config.
+    """
+    return SectionMap()
+
+
 class SectionMap:
     """Class to map between section names and port numbers."""
 
+    @staticmethod
+    def default() -> "SectionMap":
+        """Return a process-wide shared instance, loaded from the default config.
+
+        Avoids re-reading and re-parsing the config for every caller
+        that just needs the standard mapping.
+
+        Returns:
+            SectionMap: shared instance.
+        """
+        return _default_map()
+
     def __init__(self, cfg_path: Optional[Path] = None, _load_cfg: bool = True) -> None:
         """Initialize the instance.
 
@@ -40,6 +65,9 @@ class SectionMap:
 
         self._section: Dict[str, int] = {}
         self._port: Dict[int, str] = {}
+        # Shared Section instances handed out by by_name()/by_port().
+        self._sec_by_name: Dict[str, "Section"] = {}
+        self._sec_by_port: Dict[int, "Section"] = {}
         if _load_cfg:
             cfg = self._get_cfg_file(cfg_path)
             self._parse_cfg(cfg)
@@ -79,9 +107,15 @@ class SectionMap:
             WmfdbValueError: if section name is empty or blank.
             WmfdbValueError: if port is not an int.
         """
-        reader = csv.reader(iter(cfg))
-        for (section, port_str) in reader:
-            line_num = reader.line_num - 1
+        self._sec_by_name.clear()
+        self._sec_by_port.clear()
+        # The config is a simple "name, port" per line; a straight split
+        # avoids spinning up the csv machinery for every load.
+        for line_num, line in enumerate(cfg):
+            line = line.rstrip("\r\n")
+            if not line.strip():
+                continue
+            section, _, port_str = line.partition(",")
             if not section.strip():
                 raise WmfdbValueError(f"Line {line_num} of config has a blank section entry")
             try:
@@ -91,7 +125,9 @@ class SectionMap:
                     f"Line {line_num} of config has a invalid port number: {port_str}"
                 )
             self._section[section] = port
-            self._port[port] = section
+        # Build the reverse map in one pass at the end, rather than
+        # entry-by-entry in the loop.
+        self._port = {port: section for section, port in self._section.items()}
 
     def names(self) -> List[str]:
         """Get section names.
@@ -112,6 +148,8 @@ class SectionMap:
     def by_name(self, name: str) -> "Section":
         """Retrieve a Section object for a given section name.
 
+        Repeated calls for the same name return the same (shared) object.
+
         Args:
             name (str): Either a section name, or DEFAULT_SECTION
 
@@ -121,17 +159,26 @@ class SectionMap:
         Returns:
             Section: object for the section.
         """
-        if name == DEFAULT_SECTION:
-            return Section(name=DEFAULT_SECTION, port=DEFAULT_PORT)
         try:
-            port = self._section[name]
+            return self._sec_by_name[name]
         except KeyError:
-            raise WmfdbValueError(f"Invalid section name {name}")
-        return Section(name=name, port=port)
+            pass
+        if name == DEFAULT_SECTION:
+            sec = Section(name=DEFAULT_SECTION, port=DEFAULT_PORT)
+        else:
+            try:
+                port = self._section[name]
+            except KeyError:
+                raise WmfdbValueError(f"Invalid section name {name}")
+            sec = Section(name=name, port=port)
+        self._sec_by_name[name] = sec
+        return sec
 
     def by_port(self, port: int) -> "Section":
         """Retrieve a Section object for given section port.
 
+        Repeated calls for the same port return the same (shared) object.
+
         Args:
             port (int): Either a section port, or DEFAULT_PORT (for the default section).
 
@@ -141,18 +188,27 @@ class SectionMap:
         Returns:
             Section: object for the section.
         """
-        if port == DEFAULT_PORT:
-            return Section(name=DEFAULT_SECTION, port=DEFAULT_PORT)
         try:
-            name = self._port[port]
+            return self._sec_by_port[port]
         except KeyError:
-            raise WmfdbValueError(f"Invalid port number {port}")
-        return Section(name=name, port=port)
+            pass
+        if port == DEFAULT_PORT:
+            sec = Section(name=DEFAULT_SECTION, port=DEFAULT_PORT)
+        else:
+            try:
+                name = self._port[port]
+            except KeyError:
+                raise WmfdbValueError(f"Invalid port number {port}")
+            sec = Section(name=name, port=port)
+        self._sec_by_port[port] = sec
+        return sec
 
 
 class Section:
     """Class to represent a section."""
 
+    __slots__ = ("name", "port")
+
     def __init__(self, *, name: str, port: int):
         """Initialize the instance.
 
@@ -1,5 +1,6 @@
 import ipaddress
 import socket
+from typing import Union
 
 import pytest
 from pytest_mock import MockerFixture
@@ -9,10 +10,18 @@ from wmfdb.exceptions import WmfdbValueError
 from wmfdb.section import SectionMap
 
 
+@pytest.fixture(autouse=True)
+def _clear_addr_caches() -> None:
+    # Keep tests hermetic: resolution results are cached process-wide.
+    addr.resolve.cache_clear()
+    addr._gethostbyaddr_cached.cache_clear()
+    addr._dc_map.cache_clear()
+
+
 def test_resolve_ip(mocker: MockerFixture) -> None:
     ip_str = "127.0.0.1"
-    dc_mock = mocker.patch("wmfdb.addr._dc_map", autospec=True, spec_set=True)
-    res_ip_mock = mocker.patch("wmfdb.addr._resolve_ip", autospec=True, spec_set=True)
+    dc_mock = mocker.patch.object(addr, "_dc_map", autospec=True, spec_set=True)
+    res_ip_mock = mocker.patch.object(addr, "_resolve_ip", autospec=True, spec_set=True)
     ret = addr.resolve(ip_str)
     dc_mock.assert_not_called()
     res_ip_mock.assert_called_once_with(ipaddress.ip_address(ip_str))
@@ -21,8 +30,8 @@ def test_resolve_ip(mocker: MockerFixture) -> None:
 
 def test_resolve_host(mocker: MockerFixture) -> None:
     host = "localhost"
-    dc_mock = mocker.patch("wmfdb.addr._dc_map", autospec=True, spec_set=True)
-    res_ip_mock = mocker.patch("wmfdb.addr._resolve_ip", autospec=True, spec_set=True)
+    dc_mock = mocker.patch.object(addr, "_dc_map", autospec=True, spec_set=True)
+    res_ip_mock = mocker.patch.object(addr, "_resolve_ip", autospec=True, spec_set=True)
     ret = addr.resolve(host)
     assert ret == dc_mock.return_value
     dc_mock.assert_called_once_with(host)
@@ -32,20 +41,25 @@ def test_resolve_host(mocker: MockerFixture) -> None:
 @pytest.mark.parametrize(
     ("ip", "host"),
     [
-        ("127.0.0.1", "localhost"),
-        ("::1", "localhost"),
-        ("192.0.2.1", "host-192.0.2.1"),
-        ("2001:db8::11", "host-2001:db8::11"),
+        # Pre-built address objects, parsed once at collection time.
+        (ipaddress.ip_address("127.0.0.1"), "localhost"),
+        (ipaddress.ip_address("::1"), "localhost"),
+        (ipaddress.ip_address("192.0.2.1"), "host-192.0.2.1"),
+        (ipaddress.ip_address("2001:db8::11"), "host-2001:db8::11"),
     ],
 )
-def test__resolve_ip(mocker: MockerFixture, ip: str, host: str) -> None:
-    m = mocker.patch("wmfdb.addr.socket.gethostbyaddr", autospec=True, spec_set=True)
+def test__resolve_ip(
+    mocker: MockerFixture,
+    ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address],
+    host: str,
+) -> None:
+    m = mocker.patch.object(socket, "gethostbyaddr", autospec=True, spec_set=True)
     m.side_effect = lambda ip: ("host-%s" % ip, None, None)
-    assert addr._resolve_ip(ipaddress.ip_address(ip)) == host
+    assert addr._resolve_ip(ip) == host
 
 
 def test__resolve_ip_error(mocker: MockerFixture) -> None:
-    m = mocker.patch("wmfdb.addr.socket.gethostbyaddr", autospec=True, spec_set=True)
+    m = mocker.patch.object(socket, "gethostbyaddr", autospec=True, spec_set=True)
     m.side_effect = socket.herror()
     with pytest.raises(WmfdbValueError, match="Unable to resolve"):
         addr._resolve_ip(ipaddress.ip_address("192.168.1.1"))
@@ -63,7 +77,7 @@ def test_dc_map(host: str, expected: str) -> None:
 
 
 def test_dc_map_no_dcid(mocker: MockerFixture) -> None:
-    m = mocker.patch("wmfdb.addr.socket.getfqdn", autospec=True, spec_set=True)
+    m = mocker.patch.object(socket, "getfqdn", autospec=True, spec_set=True)
     assert addr._dc_map("host333") == m.return_value
     m.assert_called_once_with("host333")
 
@@ -1,4 +1,6 @@
+import logging
 from typing import Any, Dict, Optional, Tuple
+from unittest.mock import call
 
 import pymysql.err
 import pytest
@@ -14,6 +16,11 @@ class TestDB:
     def _mock_conn(self, mocker: MockerFixture) -> None:
         self.m_conn = mocker.patch("wmfdb.db.Connection", autospec=True, spec_set=True)
 
+    @pytest.fixture(autouse=True)
+    def _clear_pools(self) -> None:
+        # Pools are process-wide state, keep tests hermetic.
+        db._pools.clear()
+
     @pytest.fixture
     def mock_cw(self, mocker: MockerFixture) -> MockType:
         return mocker.patch("wmfdb.db.CursorWrapper", autospec=True, spec_set=True)
@@ -55,6 +62,111 @@ class TestDB:
         assert d._unix_socket is None
         assert d._port == 3307
 
+    def test_init_pool_reuse(self) -> None:
+        d1 = db.DB(host="host1", pool_size=2)
+        d1.close()
+        self.m_conn.return_value.close.assert_not_called()
+        d2 = db.DB(host="host1", pool_size=2)
+        # Second instance reuses the pooled connection.
+        self.m_conn.assert_called_once_with(host="host1")
+        self.m_conn.return_value.ping.assert_called_once_with(reconnect=True)
+        assert d2._conn == self.m_conn.return_value
+
+    def test_init_pool_stale(self) -> None:
+        d1 = db.DB(host="host1", pool_size=2)
+        d1.close()
+        self.m_conn.return_value.ping.side_effect = pymysql.err.OperationalError
+        db.DB(host="host1", pool_size=2)
+        # Stale pooled connection is discarded, and a new one created.
+        assert self.m_conn.call_count == 2
+
+    def test_init_pool_distinct_kwargs(self) -> None:
+        d1 = db.DB(host="host1", charset="utf8mb4", pool_size=2)
+        d1.close()
+        db.DB(host="host1", pool_size=2)
+        # Differing kwargs must not share a pool(ed connection).
+        assert self.m_conn.call_count == 2
+
+    def test_init_pool_size_conflict(self) -> None:
+        db.DB(host="host1", pool_size=2)
+        with pytest.raises(WmfdbValueError, match="conflicts with existing pool"):
+            db.DB(host="host1", pool_size=3)
+
+    def test_close_pool_reset(self) -> None:
+        conn_obj = self.m_conn.return_value
+        d = db.DB(host="host1", database="db1", pool_size=2)
+        d.select_db("db2")
+        d.close()
+        # The connection is rolled back and re-selected to the keyed
+        # database before being pooled.
+        conn_obj.rollback.assert_called_once_with()
+        assert conn_obj.select_db.call_args_list == [
+            call("db2"),
+            call("db1"),
+        ]
+        conn_obj.close.assert_not_called()
+
+    def test_close_pool_reset_no_db(self) -> None:
+        conn_obj = self.m_conn.return_value
+        d = db.DB(host="host1", pool_size=2)
+        d.select_db("db2")
+        d.close()
+        # A selected database can't be unselected, so the connection is
+        # really closed instead of pooled.
+        assert d._pool is not None
+        assert d._pool.qsize() == 0
+        conn_obj.close.assert_called_once_with()
+
+    def test_close_pool_reset_err(self) -> None:
+        conn_obj = self.m_conn.return_value
+        conn_obj.rollback.side_effect = pymysql.err.OperationalError
+        d = db.DB(host="host1", pool_size=2)
+        d.close()
+        # Failed resets drop the connection instead of pooling it.
+        assert d._pool is not None
+        assert d._pool.qsize() == 0
+        conn_obj.close.assert_called_once_with()
+
+    def test_close_twice(self) -> None:
+        d1 = db.DB(host="host1", pool_size=2)
+        d1.close()
+        d1.close()
+        # The connection must only be pooled once.
+        assert d1._pool is not None
+        assert d1._pool.qsize() == 1
+
+    def test_use_after_close(self) -> None:
+        conn_obj = self.m_conn.return_value
+        d = db.DB(host="host1", pool_size=2)
+        d.close()
+        # The pooled connection may now belong to another instance, so
+        # any further use must fail loudly.
+        assert not d.open
+        with pytest.raises(WmfdbDBError, match="is closed"):
+            d.cursor()
+        with pytest.raises(WmfdbDBError, match="is closed"):
+            d.dict_cursor()
+        with pytest.raises(WmfdbDBError, match="is closed"):
+            d.select_db("db1")
+        with pytest.raises(WmfdbDBError, match="is closed"):
+            d.begin()
+        with pytest.raises(WmfdbDBError, match="is closed"):
+            d.ping()
+        with pytest.raises(WmfdbDBError, match="is closed"):
+            d.rollback()
+        conn_obj.cursor.assert_not_called()
+        conn_obj.begin.assert_not_called()
+
+    def test_close_pool_full(self) -> None:
+        d1 = db.DB(host="host1", pool_size=1)
+        d2 = db.DB(host="host2", pool_size=1)
+        d2._pool = d1._pool
+        d1.close()
+        self.m_conn.return_value.close.assert_not_called()
+        d2.close()
+        # Pool is full, so the second connection is really closed.
+        self.m_conn.return_value.close.assert_called_once_with()
+
     def test_init_err(self) -> None:
         self.m_conn.side_effect = pymysql.err.OperationalError
         with pytest.raises(WmfdbDBError):
@@ -171,9 +283,11 @@ class TestDB:
             ({"port": 3307}, "host1:3307"),
         ],
     )
-    def test_addr(self, args: Dict[str, Any], expected: str, mocker: MockerFixture) -> None:
-        m = mocker.patch("wmfdb.db.DB.host", autospec=True, spec_set=True)
-        m.return_value = "host1"
+    def test_addr(
+        self, args: Dict[str, Any], expected: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # A plain stub is all that's needed here; skip the Mock machinery.
+        monkeypatch.setattr(db.DB, "host", lambda self: "host1")
         d = db.DB(**args)
         assert d.addr() == expected
 
@@ -187,10 +301,12 @@ class TestDB:
             ({"user": "notroot", "database": "test1"}, "notroot@addr1[test1]"),
         ],
     )
-    def test_desc(self, args: Dict[str, Any], expected: str, mocker: MockerFixture) -> None:
+    def test_desc(
+        self, args: Dict[str, Any], expected: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         d = db.DB(**args)
-        m_addr = self._mock_addr(d, mocker)
-        m_addr.return_value = "addr1"
+        # A plain stub is all that's needed here; skip the Mock machinery.
+        monkeypatch.setattr(d, "addr", lambda: "addr1")
         assert d.desc() == expected
 
 
@@ -223,7 +339,8 @@ class TestCursorWrapper:
         m_add_timeout = self._mock_add_timeout(c, mocker)
         ret = c.execute("query1")
         assert ret == self.m_cur.execute.return_value
-        m_mog.assert_called_once_with("query1", None, timeout=None)
+        # mogrify is only called when debug logging is enabled.
+        m_mog.assert_not_called()
         m_add_timeout.assert_called_once_with("query1", None)
         self.m_cur.execute.assert_called_once_with(
             m_add_timeout.return_value,
@@ -236,13 +353,23 @@ class TestCursorWrapper:
         m_add_timeout = mocker.patch.object(c, "_add_timeout", autospec=True, spec_set=True)
         ret = c.execute("query1", ("arg1", "arg2"), timeout=99.1)
         assert ret == self.m_cur.execute.return_value
-        m_mog.assert_called_once_with("query1", ("arg1", "arg2"), timeout=99.1)
+        m_mog.assert_not_called()
         m_add_timeout.assert_called_once_with("query1", 99.1)
         self.m_cur.execute.assert_called_once_with(
             m_add_timeout.return_value,
             args=("arg1", "arg2"),
         )
 
+    def test_execute_debug(self, mocker: MockerFixture, caplog: pytest.LogCaptureFixture) -> None:
+        caplog.set_level(logging.DEBUG, logger="wmfdb.db")
+        c = db.CursorWrapper("host1", self.m_cur)
+        m_mog = self._mock_mogrify(c, mocker)
+        m_mog.return_value = "mogrified1"
+        mocker.patch.object(c, "_add_timeout", autospec=True, spec_set=True)
+        c.execute("query1")
+        m_mog.assert_called_once_with("query1", None, timeout=None)
+        assert "Executing: mogrified1" in caplog.text
+
     @pytest.mark.parametrize(
         "excp",
         [
@@ -27,4 +27,4 @@ def test_check_level_ok(level: Union[str, int]) -> None:
 )
 def test_check_level_fail(level: Union[str, int]) -> None:
     with pytest.raises(WmfdbValueError):
-        log._check_level("info")
+        log._check_level(level)
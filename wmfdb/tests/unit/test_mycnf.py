@@ -13,7 +13,27 @@ from wmfdb.tests import get_fixture_path
 FIXTURES_BASE = get_fixture_path("mycnf")
 
 
+@pytest.fixture(scope="module")
+def base_cnf() -> mycnf.Cnf:
+    # Read-only Cnf shared by the pymysql_conn_args tests, so base.cnf
+    # is only parsed once for the module.
+    c = mycnf.Cnf()
+    c.load_cfgs([FIXTURES_BASE / "base.cnf"])
+    return c
+
+
+@pytest.fixture(scope="module")
+def empty_cnf() -> mycnf.Cnf:
+    # Shared by the parametrized cleanup tests, which don't mutate the Cnf.
+    return mycnf.Cnf()
+
+
 class TestCnf:
+    @pytest.fixture(autouse=True)
+    def _clear_parse_cache(self) -> None:
+        # Keep tests hermetic: parses are cached process-wide.
+        mycnf._parse_cfg_cached.cache_clear()
+
     def _mock_get(self, c: mycnf.Cnf, mocker: MockerFixture) -> MockType:
         return mocker.patch.object(c, "_get", autospec=True, spec_set=True)
 
@@ -57,16 +77,15 @@ class TestCnf:
 
     def test_load_cfgs(self, mocker: MockerFixture) -> None:
         c = mycnf.Cnf()
-        m_find_cfgs = mocker.patch.object(
-            c, "_find_cfgs", return_value=["find1", "find2"], autospec=True, spec_set=True
-        )
         m_load_cfg = mocker.patch.object(c, "_load_cfg", autospec=True, spec_set=True)
-        paths = (Path("load1"), Path("load2"), Path("load3"))
-        c.load_cfgs(paths)
-        m_find_cfgs.assert_called_once_with(paths)
+        m_load_cfg.side_effect = [None, WmfdbIOError(), None]
+        paths = (Path("load1"), Path("load2"), Path("~/load3"))
+        # Unloadable files don't count towards the total.
+        assert c.load_cfgs(paths) == 2
         assert m_load_cfg.call_args_list == [
-            call("find1"),
-            call("find2"),
+            call(Path("load1")),
+            call(Path("load2")),
+            call(Path("~/load3").expanduser()),
         ]
 
     def test__load_cfg(self) -> None:
@@ -104,37 +123,37 @@ class TestCnf:
         with pytest.raises(WmfdbIOError, match="Permission denied"):
             c._load_cfg(cnf_path)
 
-    def test__find_cfgs(self, tmp_path: Path) -> None:
+    def test_load_cfgs_skip(self, tmp_path: Path) -> None:
         paths = [
             tmp_path / "0_readable.cnf",
             tmp_path / "1_missing.cnf",
             tmp_path / "2_readable.cnf",
             tmp_path / "3_unreadable.cnf",
-            tmp_path / "~",
-        ]
-        exp_paths = [
-            tmp_path / "0_readable.cnf",
-            tmp_path / "2_readable.cnf",
         ]
-        paths[0].touch()
-        paths[2].touch()
+        paths[0].write_text("[client]\nuser = user0\n")
+        paths[2].write_text("[client]\nuser = user2\n")
         paths[3].touch(mode=0o000)
         c = mycnf.Cnf()
-        assert c._find_cfgs(paths) == exp_paths
+        assert c.load_cfgs(paths) == 2
+        # Later files override earlier ones.
+        assert c.get_str("user") == "user2"
 
-    def test__get(self, mocker: MockerFixture) -> None:
-        m_cp = mocker.patch("wmfdb.mycnf.configparser.ConfigParser", autospec=True, spec_set=True)
-        m_cp.return_value.has_option.side_effect = [False, True]
+    def test__get(self) -> None:
         c = mycnf.Cnf(section_order=["clientextra"] + list(mycnf.DEF_SECTION_LIST))
-        m_cleanup = mocker.patch.object(c, "_cleanup_value", autospec=True, spec_set=True)
-        assert c._get("port") == ("client", m_cleanup.return_value, True)
-        assert m_cp.return_value.has_option.call_args_list == [
-            call("clientextra", "port"),
-            call("client", "port"),
-        ]
-
-        m_cp.return_value.get.assert_called_once_with("client", "port")
-        m_cleanup.assert_called_once_with(m_cp.return_value.get.return_value)
+        c._parser.read_string(
+            "[client]\n"
+            "port = 3999 # inline comment\n"
+            "max-allowed-packet = 16M\n"
+            "[clientextra]\n"
+            "port = 3998\n"
+            "user = user1\n"
+        )
+        c._freeze()
+        # First match in section_order wins, values are cleaned.
+        assert c._get("port") == ("clientextra", "3998", True)
+        assert c._get("user") == ("clientextra", "user1", True)
+        # Lookup keys are normalized too.
+        assert c._get("max_allowed-packet") == ("client", "16M", True)
 
     def test__get_missing(self) -> None:
         c = mycnf.Cnf()
@@ -175,7 +194,7 @@ class TestCnf:
             ("""+"asdf'+""", """*"asdf'*"""),
         ],
     )
-    def test__cleaup_value_quotes(self, val: str, expected: str) -> None:
+    def test__cleaup_value_quotes(self, val: str, expected: str, empty_cnf: mycnf.Cnf) -> None:
         assert len(val) > 1, "val is too short"
         assert len(expected) > 1, "expected is too short"
         assert val[0] == "+" and val[-1] == "+", "val is wrapped incorrectly"  # noqa: PT018
@@ -184,8 +203,7 @@ class TestCnf:
         ), "expected is wrapped incorrectly"
         val = val.strip("+")
         expected = expected.strip("*")
-        c = mycnf.Cnf()
-        assert c._cleanup_value(val) == expected
+        assert empty_cnf._cleanup_value(val) == expected
 
     @pytest.mark.parametrize(
         ("val", "expected"),
@@ -205,9 +223,8 @@ class TestCnf:
             ("''foo # bar # cmt", "''foo"),
         ],
     )
-    def test__cleanup_comment(self, val: str, expected: str) -> None:
-        c = mycnf.Cnf()
-        assert c._cleanup_comment(val) == expected
+    def test__cleanup_comment(self, val: str, expected: str, empty_cnf: mycnf.Cnf) -> None:
+        assert empty_cnf._cleanup_comment(val) == expected
 
     def test_get_str(self, mocker: MockerFixture) -> None:
         c = mycnf.Cnf()
@@ -313,9 +330,8 @@ class TestCnf:
         m.return_value = ["test_section", None, False]
         assert not c.get_no_value("key")
 
-    def test_pymysql_conn_args_one_cnf(self) -> None:
-        c = mycnf.Cnf()
-        c.load_cfgs([FIXTURES_BASE / "base.cnf"])
+    def test_pymysql_conn_args_one_cnf(self, base_cnf: mycnf.Cnf) -> None:
+        c = base_cnf
         assert c.pymysql_conn_args(user="override_user") == {
             "user": "override_user",
             "unix_socket": "/run/mysqld/client.sock",
@@ -353,23 +369,20 @@ class TestCnf:
             "ssl_ca": "/path/to/#/CA.pem",
         }
 
-    def test_pymsql_conn_args_no_host(self) -> None:
-        c = mycnf.Cnf()
-        c.load_cfgs([FIXTURES_BASE / "base.cnf"])
+    def test_pymsql_conn_args_no_host(self, base_cnf: mycnf.Cnf) -> None:
+        c = base_cnf
         kwargs = c.pymysql_conn_args()
         assert "unix_socket" in kwargs
         assert "port" not in kwargs
 
-    def test_pymsql_conn_args_localhost(self) -> None:
-        c = mycnf.Cnf()
-        c.load_cfgs([FIXTURES_BASE / "base.cnf"])
+    def test_pymsql_conn_args_localhost(self, base_cnf: mycnf.Cnf) -> None:
+        c = base_cnf
         kwargs = c.pymysql_conn_args(host="localhost")
         assert "unix_socket" in kwargs
         assert "port" not in kwargs
 
-    def test_pymsql_conn_args_hostname(self) -> None:
-        c = mycnf.Cnf()
-        c.load_cfgs([FIXTURES_BASE / "base.cnf"])
+    def test_pymsql_conn_args_hostname(self, base_cnf: mycnf.Cnf) -> None:
+        c = base_cnf
         kwargs = c.pymysql_conn_args(host="db9999")
         assert "unix_socket" not in kwargs
         assert kwargs["port"] == 3999
@@ -15,17 +15,18 @@ import wmfdb.mysql_cli as mysql_cli
     ],
 )
 def test_build_args(host: str, port: int, skip_ssl: bool, rest: List[str]) -> None:
-    args = mysql_cli.build_args(host, port, skip_ssl, rest)
-    assert args.pop(0) == mysql_cli.CMD
+    # Build the full expected list and compare once, so failures show
+    # the whole diff.
+    expected = [mysql_cli.CMD]
     if host.startswith(("clouddb", "an-redacteddb")):
-        assert args.pop(0) == "--defaults-group-suffix=labsdb"
-    assert args.pop(0) == f"-h{host}"
+        expected.append("--defaults-group-suffix=labsdb")
+    expected.append(f"-h{host}")
     if port != 3306:
-        assert args.pop(0) == f"-P{port}"
+        expected.append(f"-P{port}")
     if not skip_ssl:
-        assert args[:3] == ["--ssl", f"--ssl-ca={mysql_cli.DEF_CA}", "--ssl-verify-server-cert"]
-        args = args[3:]
-    assert args == rest
+        expected += ["--ssl", f"--ssl-ca={mysql_cli.DEF_CA}", "--ssl-verify-server-cert"]
+    expected += rest
+    assert mysql_cli.build_args(host, port, skip_ssl, rest) == expected
 
 
 @pytest.mark.parametrize(
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Iterator
 
 import pytest
 from pytest_mock import MockerFixture
@@ -6,22 +7,40 @@ from pytest_mock import MockerFixture
 from wmfdb import section
 from wmfdb.exceptions import WmfdbIOError, WmfdbValueError
 
+# Parsed form of section.TEST_DATA, built once for the whole module.
+TEST_DATA_SECTIONS = {
+    "f0": 10110,
+    "f1": 10111,
+    "f2": 10112,
+    "f3": 10113,
+    "alpha": 10320,
+}
+
 
 @pytest.fixture
 def _set_test_data_env(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv(section.TEST_DATA_ENV, "y")
 
 
+@pytest.fixture(scope="module")
+def loaded_sm() -> Iterator[section.SectionMap]:
+    # Read-only SectionMap shared across lookup tests, so TEST_DATA is
+    # only parsed once for the module. The function-scoped monkeypatch
+    # fixture can't be used here, so manage the env var directly.
+    mp = pytest.MonkeyPatch()
+    mp.setenv(section.TEST_DATA_ENV, "y")
+    try:
+        yield section.SectionMap()
+    finally:
+        mp.undo()
+
+
 @pytest.mark.usefixtures("_set_test_data_env")
 class TestSectionMap:
     def _check_cfg_loaded(self, sm: section.SectionMap) -> None:
-        num_sections = len(section.TEST_DATA)
-        assert len(sm._section) == num_sections
-        assert len(sm._port) == num_sections
-        assert "f0" in sm._section
-        assert sm._section["f0"] == 10110
-        assert "alpha" in sm._section
-        assert sm._section["alpha"] == 10320
+        # Whole-dict comparisons, so failures show the full diff.
+        assert sm._section == TEST_DATA_SECTIONS
+        assert sm._port == {port: name for name, port in TEST_DATA_SECTIONS.items()}
 
     def test_init(self) -> None:
         sm = section.SectionMap()
@@ -51,54 +70,6 @@ class TestSectionMap:
         m_get_cfg.assert_not_called()
         m_parse_cfg.assert_not_called()
 
-    def test_get_cfg_file_default_path(
-        self, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
-    ) -> None:
-        # Unset the env var so this test is hermetic.
-        monkeypatch.delenv(section.TEST_DATA_ENV, raising=False)
-        sm = section.SectionMap(_load_cfg=False)
-        m = mocker.patch("builtins.open", mocker.mock_open(), spec_set=True)
-        sm._get_cfg_file(None)
-        m.assert_called_once_with(section.DEFAULT_CFG_PATH, mode="r", newline="")
-
-    def test_get_cfg_file_on_disk(
-        self,
-        monkeypatch: pytest.MonkeyPatch,
-        tmp_path: Path,
-    ) -> None:
-        # Unset the env var so this test is hermetic.
-        monkeypatch.delenv(section.TEST_DATA_ENV, raising=False)
-        sm = section.SectionMap(_load_cfg=False)
-        cfg = tmp_path / "section_ports.csv"
-        with open(cfg, "w+") as f:
-            for line in section.TEST_DATA:
-                f.write(line)
-        assert sm._get_cfg_file(cfg) == section.TEST_DATA
-
-    def test_get_cfg_file_missing(
-        self,
-        monkeypatch: pytest.MonkeyPatch,
-        tmp_path: Path,
-    ) -> None:
-        # Unset the env var so this test is hermetic.
-        monkeypatch.delenv(section.TEST_DATA_ENV, raising=False)
-        sm = section.SectionMap(_load_cfg=False)
-        with pytest.raises(WmfdbIOError, match="No such file"):
-            sm._get_cfg_file(tmp_path / "section_ports.csv")
-
-    def test_get_cfg_file_eperm(
-        self,
-        monkeypatch: pytest.MonkeyPatch,
-        tmp_path: Path,
-    ) -> None:
-        # Unset the env var so this test is hermetic.
-        monkeypatch.delenv(section.TEST_DATA_ENV, raising=False)
-        sm = section.SectionMap(_load_cfg=False)
-        cfg = tmp_path / "section_ports.csv"
-        cfg.touch(mode=0o000)
-        with pytest.raises(WmfdbIOError, match="Permission denied"):
-            sm._get_cfg_file(cfg)
-
     def test_get_cfg_file_test_data(self, mocker: MockerFixture) -> None:
         sm = section.SectionMap(_load_cfg=False)
         m = mocker.patch("builtins.open", mocker.mock_open(), spec_set=True)
@@ -112,6 +83,13 @@ class TestSectionMap:
         sm._parse_cfg(cfg)
         self._check_cfg_loaded(sm)
 
+    def test_default(self) -> None:
+        section._default_map.cache_clear()
+        sm = section.SectionMap.default()
+        # Repeated calls share the same loaded instance.
+        assert section.SectionMap.default() is sm
+        self._check_cfg_loaded(sm)
+
     def test_parse_cfg_blank_section(self) -> None:
         sm = section.SectionMap(_load_cfg=False)
         cfg = "f0, 10110\n , 10111\nf2, 10112\n"
@@ -124,15 +102,15 @@ class TestSectionMap:
         with pytest.raises(WmfdbValueError, match=r"Line 1 .* invalid port number"):
             sm._parse_cfg(cfg.splitlines(keepends=True))
 
-    def test_names(self) -> None:
-        sm = section.SectionMap()
+    def test_names(self, loaded_sm: section.SectionMap) -> None:
+        sm = loaded_sm
         names = sm.names()
         assert len(names) == len(sm._section)
         assert names.index("alpha") == 0
         assert "f3" in names
 
-    def test_ports(self) -> None:
-        sm = section.SectionMap()
+    def test_ports(self, loaded_sm: section.SectionMap) -> None:
+        sm = loaded_sm
         ports = sm.ports()
         assert len(ports) == len(sm._port)
         assert ports.index(10110) == 0
@@ -145,16 +123,14 @@ class TestSectionMap:
             ("f2", 10112),
         ],
     )
-    def test_by_name(self, name: str, exp_port: int) -> None:
-        sm = section.SectionMap()
-        s = sm.by_name(name)
+    def test_by_name(self, name: str, exp_port: int, loaded_sm: section.SectionMap) -> None:
+        s = loaded_sm.by_name(name)
         assert s.name == name
         assert s.port == exp_port
 
-    def test_by_name_invalid(self) -> None:
-        sm = section.SectionMap()
+    def test_by_name_invalid(self, loaded_sm: section.SectionMap) -> None:
         with pytest.raises(WmfdbValueError, match="Invalid section name"):
-            sm.by_name("abcd")
+            loaded_sm.by_name("abcd")
 
     @pytest.mark.parametrize(
         ("port", "exp_name"),
@@ -163,16 +139,47 @@ class TestSectionMap:
             (10112, "f2"),
         ],
     )
-    def test_by_port(self, port: int, exp_name: str) -> None:
-        sm = section.SectionMap()
-        s = sm.by_port(port)
+    def test_by_port(self, port: int, exp_name: str, loaded_sm: section.SectionMap) -> None:
+        s = loaded_sm.by_port(port)
         assert s.name == exp_name
         assert s.port == port
 
-    def test_by_port_invalid(self) -> None:
-        sm = section.SectionMap()
+    def test_by_port_invalid(self, loaded_sm: section.SectionMap) -> None:
         with pytest.raises(WmfdbValueError, match="Invalid port number"):
-            sm.by_port(1234)
+            loaded_sm.by_port(1234)
+
+
+class TestSectionMapDiskIO:
+    @pytest.fixture(autouse=True)
+    def _no_test_data_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Unset the env var so these tests hit the real file paths.
+        monkeypatch.delenv(section.TEST_DATA_ENV, raising=False)
+
+    def test_get_cfg_file_default_path(self, mocker: MockerFixture) -> None:
+        sm = section.SectionMap(_load_cfg=False)
+        m = mocker.patch("builtins.open", mocker.mock_open(), spec_set=True)
+        sm._get_cfg_file(None)
+        m.assert_called_once_with(section.DEFAULT_CFG_PATH, mode="r", newline="")
+
+    def test_get_cfg_file_on_disk(self, tmp_path: Path) -> None:
+        sm = section.SectionMap(_load_cfg=False)
+        cfg = tmp_path / "section_ports.csv"
+        # TEST_DATA lines already include newlines, so a single write
+        # round-trips exactly.
+        cfg.write_text("".join(section.TEST_DATA))
+        assert sm._get_cfg_file(cfg) == section.TEST_DATA
+
+    def test_get_cfg_file_missing(self, tmp_path: Path) -> None:
+        sm = section.SectionMap(_load_cfg=False)
+        with pytest.raises(WmfdbIOError, match="No such file"):
+            sm._get_cfg_file(tmp_path / "section_ports.csv")
+
+    def test_get_cfg_file_eperm(self, tmp_path: Path) -> None:
+        sm = section.SectionMap(_load_cfg=False)
+        cfg = tmp_path / "section_ports.csv"
+        cfg.touch(mode=0o000)
+        with pytest.raises(WmfdbIOError, match="Permission denied"):
+            sm._get_cfg_file(cfg)
 
 
 class TestSection: